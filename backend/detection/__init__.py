@@ -2,7 +2,27 @@
 Detection components for Mindful Touch
 """
 
-from .config import Config
-from .multi_region_detector import MultiRegionDetector
+import importlib
 
 __all__ = ["MultiRegionDetector", "Config"]
+
+# Resolved lazily (PEP 562) so light submodules like settings_store can be imported
+# without pulling in MediaPipe and OpenCV through the detector
+_LAZY_ATTRS = {
+    "Config": ".config",
+    "MultiRegionDetector": ".multi_region_detector",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        # Cache on the package so later lookups skip __getattr__ entirely
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
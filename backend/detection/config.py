@@ -10,13 +10,23 @@ class Config:
     # MediaPipe settings
     HAND_DETECTION_CONFIDENCE = 0.7
     HAND_TRACKING_CONFIDENCE = 0.7
+    HAND_MODEL_COMPLEXITY = 0  # 0 = lite hand landmark model, 1 = full (slower, slightly more accurate)
     FACE_DETECTION_CONFIDENCE = 0.7
     FACE_TRACKING_CONFIDENCE = 0.7
+    INFERENCE_HEIGHT = 480  # Frames taller than this are downscaled before MediaPipe inference
+    FACE_STRIDE = 2  # Run face mesh every Nth frame; the face moves far less than the hands
+    REFINE_LANDMARKS = False  # Iris refinement; every region uses only the 468 base mesh landmarks
 
     # Detection settings
     CONTACT_THRESHOLD = 0.05  # Distance threshold for contact detection
     MIN_DETECTION_TIME = 0.3  # Seconds before triggering alert
     MIN_MINDFUL_CONTACT_TIME = 0.2  # Minimum contact time to count as mindful stop
+    CONTACT_TOLERANCE_PX = 20  # Fingertips this close outside a region still count as contact
+
+    # Fingertip smoothing (One Euro filter): lower min cutoff = steadier when still,
+    # higher beta = less lag when moving fast
+    FINGERTIP_MIN_CUTOFF = 1.0  # Hz
+    FINGERTIP_BETA = 0.007
 
     # Visual settings
     REGION_COLOR = (0, 255, 255)  # Yellow region outlines
@@ -26,8 +36,10 @@ class Config:
     # Available regions (can be enabled/disabled)
     AVAILABLE_REGIONS = ["scalp", "eyebrows", "eyes", "mouth", "beard"]
 
-    # Currently active regions (overridden at startup by persisted user settings)
-    ACTIVE_REGIONS = ["scalp", "eyebrows", "eyes", "mouth", "beard"]
+    # Currently active regions (overridden at startup by persisted user settings).
+    # A set for O(1) toggles/membership; read it through active_regions_snapshot()
+    # when iterating, since the GUI thread mutates it while detection runs
+    ACTIVE_REGIONS = {"scalp", "eyebrows", "eyes", "mouth", "beard"}
 
     # Region-specific settings
     REGION_SETTINGS = {
@@ -38,6 +50,11 @@ class Config:
         "beard": {"contact_threshold": 0.04, "min_detection_time": 1.0, "alert_cooldown_time": 1.0, "show_landmarks": True},
     }
 
+    @classmethod
+    def active_regions_snapshot(cls) -> tuple:
+        """Active regions as a tuple, in AVAILABLE_REGIONS order"""
+        return tuple(region for region in cls.AVAILABLE_REGIONS if region in cls.ACTIVE_REGIONS)
+
     @classmethod
     def update_contact_duration(cls, duration: float):
         """Update min_detection_time for all regions"""
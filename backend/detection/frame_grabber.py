@@ -0,0 +1,72 @@
+"""
+Background frame grabber for Mindful Touch
+Reads the camera on its own thread so capture overlaps with detection
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Seconds to wait before retrying after a failed cap.read()
+READ_RETRY_DELAY = 0.05
+
+
+class FrameGrabber:
+    """Continuously reads from a cv2.VideoCapture, keeping only the newest frame"""
+
+    def __init__(self, cap):
+        self.cap = cap
+        self._cond = threading.Condition()
+        self._frame = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._stopped.is_set()
+
+    def start(self):
+        """Start the capture thread"""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="FrameGrabber", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    # Back off instead of spinning on a camera that stopped delivering;
+                    # the event wait returns immediately once stop() is called
+                    self._stopped.wait(READ_RETRY_DELAY)
+                    continue
+
+                # Overwrite rather than queue: a stale frame is never worth processing
+                with self._cond:
+                    self._frame = frame
+                    self._cond.notify()
+        except Exception as e:
+            print(f"Frame grabber stopped: {e}")
+        finally:
+            # However the loop ends (including cap.read() raising), mark the grabber
+            # stopped and wake the reader so detection does not wait on a dead camera
+            with self._cond:
+                self._stopped.set()
+                self._cond.notify_all()
+
+    def read(self, timeout: Optional[float] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """Wait for a frame newer than the last one returned, or until stop()"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame is not None or self._stopped.is_set(), timeout)
+            frame, self._frame = self._frame, None
+        return frame is not None, frame
+
+    def stop(self):
+        """Stop the capture thread and wake any waiting reader; call before releasing the camera"""
+        with self._cond:
+            self._stopped.set()
+            self._cond.notify_all()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
@@ -0,0 +1,33 @@
+"""
+Polygon geometry for Mindful Touch
+Vectorized point-to-polygon distances used by contact detection
+"""
+
+import numpy as np
+
+
+def signed_distances(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Signed distance from each point to a closed polygon, positive inside"""
+    points = points.astype(np.float64)
+    start = polygon.astype(np.float64)
+    end = np.roll(start, -1, axis=0)
+    edge = end - start
+
+    # Distance to the nearest point on every edge, (N, M); updated in place to limit temporaries
+    offset = points[:, None, :] - start[None, :, :]
+    edge_len2 = np.maximum(np.einsum("ij,ij->i", edge, edge), 1e-12)
+    t = np.einsum("nmj,mj->nm", offset, edge)
+    t /= edge_len2
+    np.clip(t, 0.0, 1.0, out=t)
+    offset -= t[..., None] * edge
+    min_dist = np.sqrt(np.einsum("nmj,nmj->nm", offset, offset).min(axis=1))
+
+    # Even-odd ray cast to the right of each point decides the sign
+    px, py = points[:, 0:1], points[:, 1:2]
+    x1, y1, x2, y2 = start[:, 0], start[:, 1], end[:, 0], end[:, 1]
+    straddles = (y1 > py) != (y2 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing_x = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    inside = np.logical_xor.reduce(straddles & (px < crossing_x), axis=1)
+
+    return np.where(inside, min_dist, -min_dist)
@@ -3,7 +3,9 @@ Multi-Region Detector for Mindful Touch
 Clean implementation supporting multiple facial regions
 """
 
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Tuple
 
 import cv2
@@ -11,9 +13,33 @@ import mediapipe as mp
 import numpy as np
 
 from .config import Config
+from .geometry import signed_distances
+from .smoothing import OneEuroFilter
+
+
+def _landmarks_to_pixels(landmark_list, width: int, height: int) -> np.ndarray:
+    """Convert a NormalizedLandmarkList to a float32 (N, 3) array of pixel x, y and raw z"""
+    points = np.array([(landmark.x, landmark.y, landmark.z) for landmark in landmark_list.landmark], dtype=np.float32).reshape(-1, 3)
+
+    # Scale in float64 and truncate to whole pixels like int() did, so values are exact in float32
+    points[:, :2] = np.trunc(points[:, :2] * np.array([width, height], dtype=np.float64))
+    return points
 
 
 class MultiRegionDetector:
+    # Face mesh landmark indices outlining each hull-based region
+    EYEBROW_INDICES = np.array(
+        [70, 63, 105, 66, 107, 55, 65, 52, 53, 46]  # Right eyebrow
+        + [285, 295, 282, 283, 276, 300, 293, 334, 296, 336],  # Left eyebrow
+        dtype=np.intp,
+    )
+    EYE_INDICES = np.array(
+        [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246]  # Right eye
+        + [362, 398, 384, 385, 386, 387, 388, 466, 263, 249, 390, 373, 374, 380, 381, 382],  # Left eye
+        dtype=np.intp,
+    )
+    MOUTH_INDICES = np.array([61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318, 78, 95, 88, 178, 87, 14, 317, 402], dtype=np.intp)
+
     def __init__(self):
         # Initialize MediaPipe
         self.mp_hands = mp.solutions.hands
@@ -21,11 +47,15 @@ class MultiRegionDetector:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
+        # Default drawing styles are rebuilt as fresh dicts on every call; build once
+        self.hand_landmarks_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self.hand_connections_style = self.mp_drawing_styles.get_default_hand_connections_style()
+
         # Create MediaPipe instances
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=2,
-            model_complexity=1,
+            model_complexity=Config.HAND_MODEL_COMPLEXITY,
             min_detection_confidence=Config.HAND_DETECTION_CONFIDENCE,
             min_tracking_confidence=Config.HAND_TRACKING_CONFIDENCE,
         )
@@ -33,11 +63,23 @@ class MultiRegionDetector:
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             static_image_mode=False,
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=Config.REFINE_LANDMARKS,
             min_detection_confidence=Config.FACE_DETECTION_CONFIDENCE,
             min_tracking_confidence=Config.FACE_TRACKING_CONFIDENCE,
         )
 
+        # Face mesh runs on this worker while hands run on the calling thread;
+        # MediaPipe releases the GIL during inference so the two overlap
+        self._face_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FaceMesh")
+
+        # Face landmarks are reused between face mesh runs (see Config.FACE_STRIDE)
+        self._face_frame_counter = 0
+        self._cached_face_landmarks = None
+
+        # Region polygons for the last (face landmarks, active regions) pair; both
+        # contact detection and drawing need them, and skipped face frames reuse them
+        self._regions_cache = (None, None, None)
+
         # Detection state for each region
         self.region_states = {}
         for region in Config.AVAILABLE_REGIONS:
@@ -53,45 +95,81 @@ class MultiRegionDetector:
         # Fingertip indices
         self.FINGERTIPS = [4, 8, 12, 16, 20]
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Process frame with multi-region detection"""
+        # One Euro filter per tracked hand, keyed by handedness
+        self._fingertip_filters = {}
+
+    def process_frame(self, frame: np.ndarray, draw: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Process frame with multi-region detection
+
+        With draw=False (nobody is looking at the feed) detection runs as usual but
+        the frame is returned without annotations.
+        """
+        # Downscale for inference; the models run at a few hundred pixels anyway
+        inference_frame = frame
+        if frame.shape[0] > Config.INFERENCE_HEIGHT:
+            scale = Config.INFERENCE_HEIGHT / frame.shape[0]
+            inference_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
         # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb_frame = cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB)
         rgb_frame.flags.writeable = False
 
-        # Run detection
+        # Run detection, hands and face concurrently; face only every FACE_STRIDE frames
+        run_face = self._face_frame_counter % Config.FACE_STRIDE == 0
+        self._face_frame_counter += 1
+        face_future = self._face_pool.submit(self.face_mesh.process, rgb_frame) if run_face else None
         hand_results = self.hands.process(rgb_frame)
-        face_results = self.face_mesh.process(rgb_frame)
 
-        # Convert back to BGR
-        rgb_frame.flags.writeable = True
-        annotated_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
+        # Annotate the caller's frame in place; only the RGB copy above goes to MediaPipe
+        annotated_frame = frame
 
-        # Extract landmarks
+        # Extract landmarks (normalized by MediaPipe, so scale to the full-resolution frame)
         hand_landmarks = self._extract_hand_landmarks(hand_results, frame.shape)
-        face_landmarks = self._extract_face_landmarks(face_results, frame.shape)
+        self._smooth_fingertips(hand_results, hand_landmarks)
+        if face_future is not None:
+            self._cached_face_landmarks = self._extract_face_landmarks(face_future.result(), frame.shape)
+        face_landmarks = self._cached_face_landmarks
+
+        # Snapshot active regions once per frame (the GUI may toggle them mid-frame)
+        active_regions = Config.active_regions_snapshot()
 
         # Detect contacts for all active regions
-        contact_data = self._detect_contacts(hand_landmarks, face_landmarks)
+        contact_data = self._detect_contacts(hand_landmarks, face_landmarks, active_regions)
 
         # Apply temporal filtering
         filtered_data = self._apply_temporal_filtering(contact_data)
 
         # Draw visualizations
-        self._draw_hands(annotated_frame, hand_results)
-        if face_landmarks is not None:
-            self._draw_active_regions(annotated_frame, face_landmarks)
-        self._draw_contact_points(annotated_frame, filtered_data)
+        if draw:
+            self._draw_hands(annotated_frame, hand_results)
+            if face_landmarks is not None:
+                self._draw_active_regions(annotated_frame, face_landmarks, active_regions)
+            self._draw_contact_points(annotated_frame, filtered_data)
+
+        # Summarize per-region results in a single pass
+        contact_points = 0
+        regions_with_contact = []
+        alerts_active = []
+        mindful_stops_detected = []
+        for region, data in filtered_data.items():
+            num_contacts = len(data["contacts"])
+            if num_contacts:
+                contact_points += num_contacts
+                regions_with_contact.append(region)
+            if data["should_play_sound"]:
+                alerts_active.append(region)
+            if data["mindful_stop_detected"]:
+                mindful_stops_detected.append(region)
 
         # Prepare detection data
         detection_data = {
             "hands_detected": len(hand_landmarks) > 0,
             "face_detected": face_landmarks is not None,
-            "contact_points": sum(len(data["contacts"]) for data in filtered_data.values()),
+            "contact_points": contact_points,
             "active_regions": list(filtered_data.keys()),
-            "regions_with_contact": [region for region, data in filtered_data.items() if len(data["contacts"]) > 0],
-            "alerts_active": [region for region, data in filtered_data.items() if data.get("should_play_sound", False)],
-            "mindful_stops_detected": [region for region, data in filtered_data.items() if data.get("mindful_stop_detected", False)],
+            "regions_with_contact": regions_with_contact,
+            "alerts_active": alerts_active,
+            "mindful_stops_detected": mindful_stops_detected,
             "region_details": filtered_data,
         }
 
@@ -103,79 +181,102 @@ class MultiRegionDetector:
         if results.multi_hand_landmarks:
             height, width = frame_shape[:2]
             for hand_landmarks in results.multi_hand_landmarks:
-                hand_points = []
-                for landmark in hand_landmarks.landmark:
-                    x = int(landmark.x * width)
-                    y = int(landmark.y * height)
-                    z = landmark.z
-                    hand_points.append([x, y, z])
-                landmarks.append(np.array(hand_points))
+                landmarks.append(_landmarks_to_pixels(hand_landmarks, width, height))
         return landmarks
 
+    def _smooth_fingertips(self, results, hand_landmarks: List[np.ndarray]):
+        """Smooth fingertip positions in place to steady contacts near region edges"""
+        now = time.monotonic()
+        handedness = results.multi_handedness or []
+        seen = set()
+        for i, hand in enumerate(hand_landmarks):
+            key = handedness[i].classification[0].label if i < len(handedness) else i
+            if key in seen:
+                key = i  # Both hands classified alike; fall back to detection order
+            seen.add(key)
+
+            fingertip_filter = self._fingertip_filters.get(key)
+            if fingertip_filter is None:
+                fingertip_filter = OneEuroFilter(Config.FINGERTIP_MIN_CUTOFF, Config.FINGERTIP_BETA)
+                self._fingertip_filters[key] = fingertip_filter
+            hand[self.FINGERTIPS, :2] = fingertip_filter(hand[self.FINGERTIPS, :2], now)
+
+        # Drop filters for hands that left the frame so they do not resume from stale positions
+        for key in self._fingertip_filters.keys() - seen:
+            del self._fingertip_filters[key]
+
     def _extract_face_landmarks(self, results, frame_shape) -> np.ndarray:
         """Extract face landmarks as pixel coordinates"""
         if results.multi_face_landmarks:
             height, width = frame_shape[:2]
-            face_landmarks = results.multi_face_landmarks[0]
-            face_points = []
-            for landmark in face_landmarks.landmark:
-                x = int(landmark.x * width)
-                y = int(landmark.y * height)
-                z = landmark.z
-                face_points.append([x, y, z])
-            return np.array(face_points)
+            return _landmarks_to_pixels(results.multi_face_landmarks[0], width, height)
         return None
 
-    def _detect_contacts(self, hand_landmarks: List[np.ndarray], face_landmarks: np.ndarray) -> Dict[str, List]:
+    def _detect_contacts(self, hand_landmarks: List[np.ndarray], face_landmarks: np.ndarray, active_regions: Tuple[str, ...]) -> Dict[str, List]:
         """Detect contacts for all active regions"""
         if len(hand_landmarks) == 0 or face_landmarks is None:
-            return {region: [] for region in Config.ACTIVE_REGIONS}
+            return {region: [] for region in active_regions}
 
         # Create region polygons
-        regions = self._create_region_polygons(face_landmarks)
+        regions = self._create_region_polygons(face_landmarks, active_regions)
+
+        # Stack every fingertip once: (N, 2) points in hand-then-fingertip order
+        fingertips = np.concatenate([hand[self.FINGERTIPS, :2] for hand in hand_landmarks])
+        fingertip_ids = self.FINGERTIPS * len(hand_landmarks)
+        tolerance = Config.CONTACT_TOLERANCE_PX
 
         # Detect contacts for each active region
         contact_data = {}
-        for region in Config.ACTIVE_REGIONS:
+        for region in active_regions:
             contact_data[region] = []
 
-            if region in regions:
-                region_polygon = regions[region]
+            region_polygon = regions.get(region)
+            if region_polygon is None or len(region_polygon) <= 2:
+                continue
 
-                # Check each hand
-                for hand in hand_landmarks:
-                    for fingertip_idx in self.FINGERTIPS:
-                        fingertip = hand[fingertip_idx][:2]
+            # Cheap bounding-box reject: only fingertips within tolerance of the box can touch
+            xmin, ymin = region_polygon.min(axis=0) - tolerance
+            xmax, ymax = region_polygon.max(axis=0) + tolerance
+            candidates = np.flatnonzero(
+                (fingertips[:, 0] >= xmin) & (fingertips[:, 0] <= xmax) & (fingertips[:, 1] >= ymin) & (fingertips[:, 1] <= ymax)
+            )
+            if len(candidates) == 0:
+                continue
 
-                        # Check distance to region
-                        if len(region_polygon) > 2:
-                            distance = cv2.pointPolygonTest(region_polygon, tuple(fingertip), True)
+            # Signed distance of the remaining fingertips (positive inside, like pointPolygonTest)
+            distances = signed_distances(fingertips[candidates], region_polygon)
 
-                            # Within contact threshold
-                            if distance >= -20:  # 20 pixels tolerance
-                                contact_data[region].append({"point": fingertip, "fingertip_idx": fingertip_idx, "distance": abs(distance)})
+            # Within contact threshold
+            for i, distance in zip(candidates, distances):
+                if distance >= -tolerance:
+                    contact_data[region].append({"point": fingertips[i], "fingertip_idx": fingertip_ids[i], "distance": abs(float(distance))})
 
         return contact_data
 
-    def _create_region_polygons(self, face_landmarks: np.ndarray) -> Dict[str, np.ndarray]:
+    def _create_region_polygons(self, face_landmarks: np.ndarray, active_regions: Tuple[str, ...]) -> Dict[str, np.ndarray]:
         """Create polygons for all regions"""
+        cached_landmarks, cached_active, cached_regions = self._regions_cache
+        if cached_landmarks is face_landmarks and cached_active == active_regions:
+            return cached_regions
+
         regions = {}
 
-        if "scalp" in Config.ACTIVE_REGIONS:
+        if "scalp" in active_regions:
             regions["scalp"] = self._create_scalp_region(face_landmarks)
 
-        if "eyebrows" in Config.ACTIVE_REGIONS:
+        if "eyebrows" in active_regions:
             regions["eyebrows"] = self._create_eyebrow_region(face_landmarks)
 
-        if "eyes" in Config.ACTIVE_REGIONS:
+        if "eyes" in active_regions:
             regions["eyes"] = self._create_eye_region(face_landmarks)
 
-        if "mouth" in Config.ACTIVE_REGIONS:
+        if "mouth" in active_regions:
             regions["mouth"] = self._create_mouth_region(face_landmarks)
 
-        if "beard" in Config.ACTIVE_REGIONS:
+        if "beard" in active_regions:
             regions["beard"] = self._create_beard_region(face_landmarks)
 
+        self._regions_cache = (face_landmarks, active_regions, regions)
         return regions
 
     def _create_scalp_region(self, face_landmarks: np.ndarray) -> np.ndarray:
@@ -188,101 +289,36 @@ class MultiRegionDetector:
         right_forehead = face_landmarks[332][:2]
 
         # Calculate face width and height for scaling
-        face_width = np.linalg.norm(left_temple - right_temple)
+        face_width = math.hypot(left_temple[0] - right_temple[0], left_temple[1] - right_temple[1])
         scalp_height = face_width * 0.6  # Adjustable parameter
 
-        # Create scalp region above the forehead
-        scalp_points = []
-        scalp_points.append(left_forehead)
-        scalp_points.append(left_temple)
-
-        # Extend upward for scalp area
-        left_scalp_top = left_temple + np.array([-face_width * 0.1, -scalp_height])
-        right_scalp_top = right_temple + np.array([face_width * 0.1, -scalp_height])
-        center_scalp_top = forehead_center + np.array([0, -scalp_height * 1.5])
-        scalp_points.extend([left_scalp_top, center_scalp_top, right_scalp_top])
-        scalp_points.extend([right_temple, right_forehead])
+        # Create scalp region above the forehead, extending upward from the temples
+        scalp_points = np.empty((7, 2), dtype=np.int32)
+        scalp_points[0] = left_forehead
+        scalp_points[1] = left_temple
+        scalp_points[2] = (left_temple[0] - face_width * 0.1, left_temple[1] - scalp_height)
+        scalp_points[3] = (forehead_center[0], forehead_center[1] - scalp_height * 1.5)
+        scalp_points[4] = (right_temple[0] + face_width * 0.1, right_temple[1] - scalp_height)
+        scalp_points[5] = right_temple
+        scalp_points[6] = right_forehead
 
-        return np.array(scalp_points, dtype=np.int32)
+        return scalp_points
 
     def _create_eyebrow_region(self, face_landmarks: np.ndarray) -> np.ndarray:
         """Create eyebrow region"""
-        # Left and right eyebrow landmarks
-        eyebrow_indices = [
-            70,
-            63,
-            105,
-            66,
-            107,
-            55,
-            65,
-            52,
-            53,
-            46,  # Right eyebrow
-            285,
-            295,
-            282,
-            283,
-            276,
-            300,
-            293,
-            334,
-            296,
-            336,
-        ]  # Left eyebrow
-
-        eyebrow_points = face_landmarks[eyebrow_indices][:, :2]
+        eyebrow_points = face_landmarks[self.EYEBROW_INDICES, :2]
         hull = cv2.convexHull(eyebrow_points.astype(np.int32))
         return hull.reshape(-1, 2)
 
     def _create_eye_region(self, face_landmarks: np.ndarray) -> np.ndarray:
         """Create eye region"""
-        # Left and right eye landmarks
-        eye_indices = [
-            33,
-            7,
-            163,
-            144,
-            145,
-            153,
-            154,
-            155,
-            133,
-            173,
-            157,
-            158,
-            159,
-            160,
-            161,
-            246,  # Right eye
-            362,
-            398,
-            384,
-            385,
-            386,
-            387,
-            388,
-            466,
-            263,
-            249,
-            390,
-            373,
-            374,
-            380,
-            381,
-            382,
-        ]  # Left eye
-
-        eye_points = face_landmarks[eye_indices][:, :2]
+        eye_points = face_landmarks[self.EYE_INDICES, :2]
         hull = cv2.convexHull(eye_points.astype(np.int32))
         return hull.reshape(-1, 2)
 
     def _create_mouth_region(self, face_landmarks: np.ndarray) -> np.ndarray:
         """Create mouth region"""
-        # Mouth landmarks
-        mouth_indices = [61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324, 308]
-
-        mouth_points = face_landmarks[mouth_indices][:, :2]
+        mouth_points = face_landmarks[self.MOUTH_INDICES, :2]
         hull = cv2.convexHull(mouth_points.astype(np.int32))
         return hull.reshape(-1, 2)
 
@@ -299,7 +335,7 @@ class MultiRegionDetector:
 
         # Calculate face center and dimensions
         face_center_x = (mouth_left[0] + mouth_right[0]) / 2
-        face_width = np.linalg.norm(left_cheek - right_cheek)
+        face_width = math.hypot(left_cheek[0] - right_cheek[0], left_cheek[1] - right_cheek[1])
 
         # Define region boundaries
         # Extend wider to include cheek facial hair
@@ -317,18 +353,18 @@ class MultiRegionDetector:
         bottom_y = chin_center[1] + region_height * 0.7
 
         # Create expanded facial hair region (clockwise)
-        beard_points = [
-            [left_x, top_y],  # Top left (cheek area)
-            [right_x, top_y],  # Top right (cheek area)
-            [right_x, bottom_y],  # Bottom right (jawline)
-            [left_x, bottom_y],  # Bottom left (jawline)
-        ]
+        beard_points = np.empty((4, 2), dtype=np.int32)
+        beard_points[0] = (left_x, top_y)  # Top left (cheek area)
+        beard_points[1] = (right_x, top_y)  # Top right (cheek area)
+        beard_points[2] = (right_x, bottom_y)  # Bottom right (jawline)
+        beard_points[3] = (left_x, bottom_y)  # Bottom left (jawline)
 
-        return np.array(beard_points, dtype=np.int32)
+        return beard_points
 
     def _apply_temporal_filtering(self, contact_data: Dict[str, List]) -> Dict[str, Dict]:
         """Apply temporal filtering with proper alert cooldown for each region"""
-        current_time = time.time()
+        # Monotonic clock: durations must not jump when the wall clock is adjusted
+        current_time = time.monotonic()
         filtered_data = {}
 
         for region, contacts in contact_data.items():
@@ -406,13 +442,13 @@ class MultiRegionDetector:
                     frame,
                     hand_landmarks,
                     self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style(),
+                    self.hand_landmarks_style,
+                    self.hand_connections_style,
                 )
 
-    def _draw_active_regions(self, frame: np.ndarray, face_landmarks: np.ndarray):
+    def _draw_active_regions(self, frame: np.ndarray, face_landmarks: np.ndarray, active_regions: Tuple[str, ...]):
         """Draw only active region boundaries"""
-        regions = self._create_region_polygons(face_landmarks)
+        regions = self._create_region_polygons(face_landmarks, active_regions)
 
         for region_name, region_polygon in regions.items():
             if len(region_polygon) > 2:
@@ -424,30 +460,27 @@ class MultiRegionDetector:
                 cv2.putText(frame, region_name.upper(), tuple(center), cv2.FONT_HERSHEY_SIMPLEX, 0.6, Config.REGION_COLOR, 2)
 
     def _draw_contact_points(self, frame: np.ndarray, filtered_data: Dict[str, Dict]):
-        """Draw contact points and alerts"""
-        alert_regions = []
-
-        for region, data in filtered_data.items():
-            # Draw contact points
-            for contact in data["contacts"]:
-                point = tuple(contact["point"].astype(int))
-                cv2.circle(frame, point, 8, Config.CONTACT_COLOR, -1)
-                cv2.circle(frame, point, 12, Config.CONTACT_COLOR, 2)
-                cv2.circle(frame, point, 16, (255, 255, 255), 1)
+        """Draw contact points"""
+        points = [contact["point"] for data in filtered_data.values() for contact in data["contacts"]]
+        if not points:
+            return
 
-            # Track alert regions
-            if data["alert_active"]:
-                alert_regions.append(region)
+        # Convert every point to integer pixels in one go, then draw the three rings
+        for x, y in np.asarray(points, dtype=np.int32).tolist():
+            cv2.circle(frame, (x, y), 8, Config.CONTACT_COLOR, -1)
+            cv2.circle(frame, (x, y), 12, Config.CONTACT_COLOR, 2)
+            cv2.circle(frame, (x, y), 16, (255, 255, 255), 1)
 
     def toggle_region(self, region: str):
         """Toggle region on/off"""
         if region in Config.AVAILABLE_REGIONS:
             if region in Config.ACTIVE_REGIONS:
-                Config.ACTIVE_REGIONS.remove(region)
+                Config.ACTIVE_REGIONS.discard(region)
             else:
-                Config.ACTIVE_REGIONS.append(region)
+                Config.ACTIVE_REGIONS.add(region)
 
     def cleanup(self):
         """Clean up MediaPipe resources"""
+        self._face_pool.shutdown(wait=True)
         self.hands.close()
         self.face_mesh.close()
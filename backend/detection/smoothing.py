@@ -0,0 +1,53 @@
+"""
+Temporal smoothing for Mindful Touch
+One Euro filter for jittery landmark positions
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+
+class OneEuroFilter:
+    """One Euro filter (Casiez et al.) applied element-wise to a fixed-shape array
+
+    Strong smoothing while a point is still, little lag once it moves quickly.
+    """
+
+    def __init__(self, min_cutoff: float, beta: float, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._value: Optional[np.ndarray] = None
+        self._derivative: Optional[np.ndarray] = None
+        self._last_time = 0.0
+
+    @staticmethod
+    def _alpha(cutoff, dt: float):
+        """Smoothing factor of a first-order low-pass at the given cutoff (Hz)"""
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, value: np.ndarray, timestamp: float) -> np.ndarray:
+        """Filter a new sample taken at timestamp (seconds)"""
+        value = np.asarray(value, dtype=np.float64)
+        if self._value is None or value.shape != self._value.shape:
+            self._value = value.copy()
+            self._derivative = np.zeros_like(value)
+            self._last_time = timestamp
+            return self._value
+
+        dt = timestamp - self._last_time
+        if dt <= 0:
+            return self._value
+        self._last_time = timestamp
+
+        # Smoothed speed drives the cutoff: faster movement, less smoothing
+        derivative = (value - self._value) / dt
+        alpha_d = self._alpha(self.d_cutoff, dt)
+        self._derivative = alpha_d * derivative + (1.0 - alpha_d) * self._derivative
+
+        alpha = self._alpha(self.min_cutoff + self.beta * np.abs(self._derivative), dt)
+        self._value = alpha * value + (1.0 - alpha) * self._value
+        return self._value
@@ -4,7 +4,9 @@ Mindful Touch - Modern Glass UI Implementation
 Facial touch detection with beautiful, minimal interface
 """
 
+import gc
 import os
+import platform
 import subprocess
 import sys
 import time
@@ -12,12 +14,13 @@ from pathlib import Path
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QFont, QFontDatabase, QImage, QPixmap
 from PyQt6.QtWidgets import QApplication, QHBoxLayout, QMainWindow, QMessageBox, QVBoxLayout, QWidget
 
 from backend.detection import settings_store
 from backend.detection.config import Config
+from backend.detection.frame_grabber import FrameGrabber
 from backend.detection.multi_region_detector import MultiRegionDetector
 from ui.panels.camera_panel import CameraPanel
 from ui.panels.detection_panel import DetectionPanel
@@ -25,6 +28,15 @@ from ui.styles.theme import Theme
 from ui.widgets.status_badge import AppHeader, StatusBadge
 
 ALERT_SOUND = "/System/Library/Sounds/Glass.aiff"
+# Absolute path so the spawn skips the PATH search
+AFPLAY = "/usr/bin/afplay"
+
+# Native capture backends per platform, tried before falling back to CAP_ANY
+CAMERA_BACKENDS = {
+    "Darwin": [cv2.CAP_AVFOUNDATION],
+    "Linux": [cv2.CAP_V4L2],
+    "Windows": [cv2.CAP_DSHOW, cv2.CAP_MSMF],
+}
 
 
 def resource_path(relative):
@@ -53,7 +65,13 @@ class CameraThread(QThread):
         self.running = False
         self.detector = None
         self.cap = None
+        self.grabber = None
         self.is_stopping = False
+        # At most one preview frame queued to the GUI thread; set here, cleared
+        # by frame_consumed() once the GUI has drawn it
+        self.frame_pending = False
+        # Cleared in privacy mode: nobody is looking, so skip preview delivery
+        self.stream_frames = True
 
     def start_detection(self):
         """Start detection with proper state protection"""
@@ -68,16 +86,22 @@ class CameraThread(QThread):
 
             # Create new detector and camera
             self.detector = MultiRegionDetector()
-            self.cap = cv2.VideoCapture(0)
+            self.cap = self._open_camera(0)
 
-            if not self.cap.isOpened():
+            if self.cap is None:
                 print("Failed to open camera")
                 self._cleanup_resources()
                 return False
 
+            # Keep the driver queue to one frame so we never process stale frames
+            # (ignored by backends that don't support it)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
             # Set state and start thread
             self.running = True
             self.is_stopping = False
+            self.frame_pending = False
+            self.stream_frames = True
             self.start()
             return True
 
@@ -86,6 +110,16 @@ class CameraThread(QThread):
             self._cleanup_resources()
             return False
 
+    @staticmethod
+    def _open_camera(index):
+        """Open the camera, trying the platform's native backend before CAP_ANY"""
+        for backend in CAMERA_BACKENDS.get(platform.system(), []) + [cv2.CAP_ANY]:
+            cap = cv2.VideoCapture(index, backend)
+            if cap.isOpened():
+                return cap
+            cap.release()
+        return None
+
     def stop_detection(self):
         """Stop detection with proper state protection"""
         # Prevent double stopping
@@ -102,6 +136,12 @@ class CameraThread(QThread):
             self.is_stopping = True
             self.running = False
 
+            # Wake the detection loop if it is waiting on a frame; read the attribute
+            # once, since run() clears it from the camera thread when the loop exits
+            grabber = self.grabber
+            if grabber:
+                grabber.stop()
+
             # Wait for thread to finish with timeout
             if self.isRunning():
                 if not self.wait(3000):  # 3 second timeout
@@ -133,16 +173,39 @@ class CameraThread(QThread):
             print(f"Error during cleanup: {e}")
 
     def run(self):
-        while self.running and self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
+        if not self.cap:
+            return
+
+        # Capture runs on its own thread so cap.read() overlaps with process_frame
+        self.grabber = FrameGrabber(self.cap)
+        self.grabber.start()
+        try:
+            self._detection_loop(self.grabber)
+        finally:
+            self.grabber.stop()
+            self.grabber = None
+
+    def _detection_loop(self, grabber):
+        # read() blocks until a new frame arrives or stop_detection() stops the grabber
+        while self.running and grabber.running:
+            ret, frame = grabber.read()
             if not ret:
                 continue
 
             if self.detector:
-                annotated_frame, detection_data = self.detector.process_frame(frame)
-                self.frame_ready.emit(annotated_frame)
+                annotated_frame, detection_data = self.detector.process_frame(frame, draw=self.stream_frames)
+                # Drop preview frames while the GUI is still behind (or the feed is
+                # hidden), so queued signals never pile up; detection data is
+                # always delivered
+                if self.stream_frames and not self.frame_pending:
+                    self.frame_pending = True
+                    self.frame_ready.emit(annotated_frame)
                 self.detection_data.emit(detection_data)
 
+    def frame_consumed(self):
+        """Called by the GUI once the last preview frame has been handled"""
+        self.frame_pending = False
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -152,6 +215,7 @@ class MainWindow(QMainWindow):
         self.show_feed = True
         self.current_flash_state = "none"
         self.is_transitioning = False  # Prevent rapid state changes
+        self._preview_buffer = None  # Reused downscale target for the camera preview
 
         # Session tracking
         self.session_start_time = None
@@ -165,7 +229,7 @@ class MainWindow(QMainWindow):
 
         # Load persisted settings before building the UI so toggles initialize correctly
         self.settings = settings_store.load()
-        Config.ACTIVE_REGIONS = [r for r in self.settings["active_regions"] if r in Config.AVAILABLE_REGIONS]
+        Config.ACTIVE_REGIONS = {r for r in self.settings["active_regions"] if r in Config.AVAILABLE_REGIONS}
         Config.update_contact_duration(self.settings["alert_delay"])
 
         self.setup_ui()
@@ -281,18 +345,35 @@ class MainWindow(QMainWindow):
         try:
             # Only update camera if detection is running
             if self.is_detecting and frame is not None:
-                height, width, channel = frame.shape
+                preview = self._fit_to_label(frame)
+                height, width, channel = preview.shape
                 bytes_per_line = 3 * width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).rgbSwapped()
-
-                pixmap = QPixmap.fromImage(q_image)
-                # Scale to fit the actual camera label size
-                label_size = self.camera_panel.camera_label.size()
-                scaled_pixmap = pixmap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.camera_panel.update_camera_frame(scaled_pixmap)
+                # BGR888 wraps the OpenCV buffer as-is (no rgbSwapped copy);
+                # fromImage takes its own copy, so the buffer can be reused
+                q_image = QImage(preview.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
+                self.camera_panel.update_camera_frame(QPixmap.fromImage(q_image))
         except Exception as e:
             print(f"Error updating camera display: {e}")
             # Don't crash the app on camera display errors
+        finally:
+            self.camera_thread.frame_consumed()
+
+    def _fit_to_label(self, frame):
+        """Scale frame to fit the camera label, reusing one output buffer"""
+        label_size = self.camera_panel.camera_label.size()
+        height, width = frame.shape[:2]
+        scale = min(label_size.width() / width, label_size.height() / height)
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        # Reallocate only when the label is resized
+        if self._preview_buffer is None or self._preview_buffer.shape[1::-1] != target:
+            self._preview_buffer = np.empty((target[1], target[0], 3), dtype=np.uint8)
+
+        # INTER_AREA is the cheaper (and alias-free) kernel for downscaling, but it enlarges
+        # close to nearest-neighbour; use bilinear when the label is bigger than the frame
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        cv2.resize(frame, target, dst=self._preview_buffer, interpolation=interpolation)
+        return self._preview_buffer
 
     def update_detection(self, data):
         """Update detection data with error handling"""
@@ -445,6 +526,7 @@ class MainWindow(QMainWindow):
     def toggle_privacy(self):
         """Toggle camera feed visibility without stopping detection"""
         self.show_feed = not self.show_feed
+        self.camera_thread.stream_frames = self.show_feed
         self.camera_panel.set_privacy_state(self.show_feed)
 
     def _central_style(self, tint=None, border_color=None):
@@ -482,20 +564,24 @@ class MainWindow(QMainWindow):
     def toggle_region(self, region: str, enabled: bool):
         """Handle region toggle from settings panel"""
         # Update Config directly so toggles work before detection starts too;
-        # the detector reads Config.ACTIVE_REGIONS live on every frame
-        if enabled and region not in Config.ACTIVE_REGIONS:
-            Config.ACTIVE_REGIONS.append(region)
-        elif not enabled and region in Config.ACTIVE_REGIONS:
-            Config.ACTIVE_REGIONS.remove(region)
+        # the detector snapshots Config.ACTIVE_REGIONS at the start of every frame
+        if enabled:
+            Config.ACTIVE_REGIONS.add(region)
+        else:
+            Config.ACTIVE_REGIONS.discard(region)
 
-        self.settings["active_regions"] = list(Config.ACTIVE_REGIONS)
-        settings_store.save(self.settings)
+        # Only hit the disk when the persisted value actually changes
+        active_regions = list(Config.active_regions_snapshot())
+        if active_regions != self.settings["active_regions"]:
+            self.settings["active_regions"] = active_regions
+            settings_store.save(self.settings)
 
     def update_contact_duration(self, duration: float):
         """Handle contact duration change from settings panel"""
         Config.update_contact_duration(duration)
-        self.settings["alert_delay"] = duration
-        settings_store.save(self.settings)
+        if duration != self.settings["alert_delay"]:
+            self.settings["alert_delay"] = duration
+            settings_store.save(self.settings)
 
     def _update_session_timer(self):
         """Update session timer display"""
@@ -511,7 +597,8 @@ class MainWindow(QMainWindow):
     def _play_alert_sound(self):
         """Play alert sound - cooldown already handled by backend"""
         try:
-            subprocess.Popen(["afplay", ALERT_SOUND, "-t", "0.35"])
+            # Output is discarded: nothing reads it, and afplay must never block on a full pipe
+            subprocess.Popen([AFPLAY, ALERT_SOUND, "-t", "0.35"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             print(f"Could not play sound: {e}")
 
@@ -545,11 +632,18 @@ class MainWindow(QMainWindow):
 
 
 def main():
+    # OpenCV only does small per-frame conversions here; its own worker pool would
+    # just contend for cores with MediaPipe's inference threads
+    cv2.setNumThreads(1)
+
     app = QApplication(sys.argv)
     load_fonts()
     app.setFont(QFont(Theme.FONT_BODY, 13))
     window = MainWindow()
     window.show()
+    # Everything allocated so far (Qt wrappers, MediaPipe/OpenCV modules) lives for
+    # the whole session; keep it out of the cyclic GC's full collections
+    gc.freeze()
     sys.exit(app.exec())
 
 
@@ -16,9 +16,13 @@ if not mediapipe_matches:
     raise SystemExit('Could not find mediapipe in .venv — run `uv sync` first')
 mediapipe_site = mediapipe_matches[0]
 
+# Only the graphs and models behind the Hands and FaceMesh solutions; the pose,
+# holistic, objectron, iris and segmentation modules are never loaded
+mediapipe_modules = ['face_detection', 'face_landmark', 'hand_landmark', 'palm_detection']
+
 datas = [
     # Include MediaPipe model files
-    (f'{mediapipe_site}/modules', 'mediapipe/modules'),
+    *[(f'{mediapipe_site}/modules/{module}', f'mediapipe/modules/{module}') for module in mediapipe_modules],
     (f'{mediapipe_site}/python/solutions', 'mediapipe/python/solutions'),
     # Bundled Work Sans fonts + logo
     ('assets/fonts', 'assets/fonts'),
@@ -44,7 +48,10 @@ a = Analysis(
         # Backend modules
         'backend.detection.multi_region_detector',
         'backend.detection.config',
+        'backend.detection.frame_grabber',
+        'backend.detection.geometry',
         'backend.detection.settings_store',
+        'backend.detection.smoothing',
         # UI modules
         'ui.panels.camera_panel',
         'ui.panels.detection_panel',
@@ -57,31 +64,40 @@ a = Analysis(
     runtime_hooks=[],
     excludes=[
         # Only exclude modules we're sure we don't need
+        # (matplotlib itself stays: mediapipe's drawing_utils imports it)
+        'tkinter',
         'IPython',
         'jupyter',
+        'notebook',
+        'ipykernel',
+        'pytest',
+        'ruff',
+        'matplotlib.tests',
+        'numpy.tests',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Byte-compile with -O (drops asserts); not -OO, matplotlib and numpy
+    # still build some docstrings at import time
+    optimize=1,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-dir build: binaries and data sit next to the executable inside the .app,
+# so launch does not unpack the whole MediaPipe/Qt payload to a temp dir first
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='Mindful Touch',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     target_arch=None,
@@ -90,8 +106,19 @@ exe = EXE(
     icon='logo.icns',
 )
 
-app = BUNDLE(
+coll = COLLECT(
     exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='Mindful Touch',
+)
+
+app = BUNDLE(
+    coll,
     name='Mindful Touch.app',
     icon='logo.icns',
     bundle_identifier='com.mindfultouch.app',
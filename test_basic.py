@@ -44,3 +44,99 @@ def test_settings_store_defaults(tmp_path, monkeypatch):
     reloaded = settings_store.load()
     assert reloaded["alert_delay"] == 2.5
     assert reloaded["active_regions"] == ["mouth"]
+
+
+def test_frame_grabber_hands_off_frames():
+    """Frame grabber delivers frames read on its background thread"""
+    import numpy as np
+
+    from backend.detection.frame_grabber import FrameGrabber
+
+    class FakeCapture:
+        def __init__(self):
+            self.count = 0
+
+        def read(self):
+            self.count += 1
+            return True, np.full((4, 4, 3), self.count % 256, dtype=np.uint8)
+
+    grabber = FrameGrabber(FakeCapture())
+    grabber.start()
+    try:
+        ret, frame = grabber.read(timeout=1.0)
+        assert ret
+        assert frame.shape == (4, 4, 3)
+    finally:
+        grabber.stop()
+
+    # Once stopped and drained, read returns immediately instead of blocking
+    grabber.read(timeout=1.0)
+    assert grabber.read(timeout=1.0) == (False, None)
+
+
+def test_signed_distances_match_point_polygon_test():
+    """Vectorized signed distances agree with cv2.pointPolygonTest"""
+    import cv2
+    import numpy as np
+
+    from backend.detection.geometry import signed_distances
+
+    polygon = np.array([[100, 100], [300, 80], [320, 260], [180, 320], [90, 240]], dtype=np.int32)
+    rng = np.random.default_rng(0)
+    points = rng.integers(0, 400, size=(200, 2)).astype(np.float64)
+
+    distances = signed_distances(points, polygon)
+    expected = [cv2.pointPolygonTest(polygon, (float(x), float(y)), True) for x, y in points]
+    assert np.allclose(distances, expected, atol=1e-6)
+
+
+def test_landmarks_to_pixels_truncates_like_int():
+    """Landmarks convert to whole-pixel x, y and raw z, matching per-landmark int() scaling"""
+    import numpy as np
+    from mediapipe.framework.formats import landmark_pb2
+
+    from backend.detection.multi_region_detector import _landmarks_to_pixels
+
+    rng = np.random.default_rng(0)
+    landmark_list = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in rng.uniform(-0.2, 1.2, size=(21, 3)):
+        landmark_list.landmark.add(x=x, y=y, z=z)
+
+    points = _landmarks_to_pixels(landmark_list, 640, 480)
+    expected = [[int(lm.x * 640), int(lm.y * 480), lm.z] for lm in landmark_list.landmark]
+    assert points.dtype == np.float32
+    assert np.array_equal(points, expected)
+    assert _landmarks_to_pixels(landmark_pb2.NormalizedLandmarkList(), 640, 480).shape == (0, 3)
+
+
+def test_one_euro_filter_smooths_jitter():
+    """One Euro filter passes the first sample through and damps jitter on a still point"""
+    import numpy as np
+
+    from backend.detection.smoothing import OneEuroFilter
+
+    rng = np.random.default_rng(0)
+    samples = 100.0 + rng.normal(0, 3, size=(60, 2))
+
+    one_euro = OneEuroFilter(min_cutoff=1.0, beta=0.007)
+    filtered = np.array([one_euro(sample, i / 30) for i, sample in enumerate(samples)])
+
+    assert np.array_equal(filtered[0], samples[0])
+    assert filtered[10:].std(axis=0).max() < samples[10:].std(axis=0).min()
+
+
+def test_frame_grabber_stops_when_capture_raises():
+    """A capture that raises stops the grabber and unblocks the reader"""
+    from backend.detection.frame_grabber import FrameGrabber
+
+    class BrokenCapture:
+        def read(self):
+            raise RuntimeError("camera unplugged")
+
+    grabber = FrameGrabber(BrokenCapture())
+    grabber.start()
+    try:
+        assert grabber.read(timeout=2.0) == (False, None)
+        assert not grabber.running
+    finally:
+        grabber.stop()
@@ -16,10 +16,16 @@ class StatusBadge(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.current_status = None
         self.set_status("ready")
 
     def set_status(self, status):
         """Update badge status and appearance"""
+        # Called on every detection frame; restyling re-polishes the widget, so skip repeats
+        if status == self.current_status:
+            return
+
+        self.current_status = status
         status_map = {"ready": "Ready", "detecting": "Detecting", "alert": "Touch noticed", "error": "Error"}
 
         text = status_map.get(status, "Unknown")